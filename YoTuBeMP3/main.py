@@ -9,10 +9,11 @@ Optimized for use in Russia with proxy support.
 
 import sys
 
+from src.__main__ import main as run_main
+
 
 def main():
     """Main entry point."""
-    from src.__main__ import main as run_main
     return run_main()
 
 
@@ -3,13 +3,13 @@ Main entry point for YouTube MP3 Downloader.
 """
 
 import sys
-import io
 from pathlib import Path
 
-# Force UTF-8 encoding on Windows
+# Force UTF-8 encoding on Windows (in place, keeping isatty/line buffering)
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+    for _stream in (sys.stdout, sys.stderr):
+        if not (_stream.encoding or '').lower().startswith('utf'):
+            _stream.reconfigure(encoding='utf-8', errors='replace')
 
 from .cli.parser import parse_args
 from .cli.output import CLIOutput
@@ -29,6 +29,11 @@ def main():
     # Setup output
     output = CLIOutput(verbose=args.verbose)
     
+    # Validate URL before any expensive setup (logging, proxies, FFmpeg)
+    if not YouTubeDownloader.validate_url(args.url):
+        output.print_error("Невалидный YouTube URL")
+        sys.exit(1)
+    
     # Setup logging
     log_file = LoggingUtils.get_log_filename()
     logger = LoggingUtils.setup_logging(
@@ -60,8 +65,8 @@ def main():
     
     # Check FFmpeg
     output.print_section("Проверка FFmpeg")
-    if converter.check_ffmpeg():
-        version = converter.get_ffmpeg_version()
+    version = converter.get_ffmpeg_version()
+    if version is not None:
         output.print_ffmpeg_info(version or "Unknown")
     else:
         output.print_error("FFmpeg не найден! Установите FFmpeg и добавьте его в PATH.")
@@ -70,14 +75,6 @@ def main():
         output.print_info("macOS: brew install ffmpeg")
         sys.exit(1)
     
-    # Validate URL
-    output.print_section("Валидация URL")
-    if not YouTubeDownloader.validate_url(args.url):
-        output.print_error("Невалидный YouTube URL")
-        sys.exit(1)
-    
-    output.print_success(f"URL валиден")
-    
     # Initialize downloader
     downloader = YouTubeDownloader(settings, proxy_manager)
     
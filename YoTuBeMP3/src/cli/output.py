@@ -2,26 +2,104 @@
 CLI output formatting with colors.
 """
 
+import shutil
+import signal
 import sys
+import time
 from typing import Optional
 from datetime import datetime
 from pathlib import Path
 
-try:
-    from colorama import Fore, Style, init
-    init(autoreset=True, strip=True)
-    HAS_COLORS = True
-except ImportError:
-    HAS_COLORS = False
-    Fore = Style = type('Dummy', (), {'RESET_ALL': '', 'RED': '', 'GREEN': '', 'YELLOW': '', 
-                                       'BLUE': '', 'CYAN': '', 'WHITE': '', 'MAGENTA': ''})
+# Colorama is imported lazily on first CLIOutput creation, so --help/--version
+# and argument errors don't pay for it
+HAS_COLORS = False
+Fore = Style = type('Dummy', (), {'RESET_ALL': '', 'RED': '', 'GREEN': '', 'YELLOW': '', 
+                                   'BLUE': '', 'CYAN': '', 'WHITE': '', 'MAGENTA': '',
+                                   'BRIGHT': ''})
+
+
+def _load_colorama() -> None:
+    """Import and initialize colorama, replacing the dummy color constants."""
+    global Fore, Style, HAS_COLORS
+    try:
+        from colorama import Fore, Style, init
+        init(autoreset=True, strip=True)
+        HAS_COLORS = True
+    except ImportError:
+        HAS_COLORS = False
+
+# Progress bar width and all possible bar strings, indexed by filled cells
+_BAR_WIDTH = 30
+_BARS = tuple('█' * i + '░' * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1))
+
+# Visible characters of the progress line besides percent, speed, ETA and filename
+_PROG_FIXED_WIDTH = len('[') + _BAR_WIDTH + len('] % ') + len(' | ETA: ') + len('  ')
 
 
 class CLIOutput:
     """Formatted CLI output."""
     
+    # Minimum interval between progress redraws (seconds), caps refresh at 20 Hz
+    PROGRESS_INTERVAL = 0.05
+    
+    # Static fragments of the progress line, built once colorama is loaded
+    _PROG_PREFIX = _PROG_MID = _PROG_SPEED = _PROG_ETA = _PROG_SUFFIX = ''
+    
+    _colorama_loaded = False
+    
+    # Terminal width shared by all instances, kept current by the SIGWINCH handler
+    _term_width = 80
+    _resize_watched = False
+    _prev_resize_handler = None
+    
     def __init__(self, verbose: bool = False):
+        if not CLIOutput._colorama_loaded:
+            _load_colorama()
+            CLIOutput._init_progress_fragments()
+            CLIOutput._colorama_loaded = True
+        
         self.verbose = verbose
+        self._last_progress = 0.0
+        # Bind stdout once so each progress update is a single write + flush
+        self._stdout = sys.stdout
+        self._write = self._stdout.write
+        # Terminal width is cached to keep ioctl calls out of the progress hot path
+        CLIOutput._term_width = self._get_terminal_width()
+        CLIOutput._watch_terminal_resize()
+    
+    @staticmethod
+    def _get_terminal_width() -> int:
+        """Get current terminal width in columns."""
+        return shutil.get_terminal_size((80, 24)).columns
+    
+    @classmethod
+    def _watch_terminal_resize(cls) -> None:
+        """Install the SIGWINCH handler once, keeping any previous handler."""
+        if cls._resize_watched or not hasattr(signal, 'SIGWINCH'):
+            return
+        
+        try:
+            cls._prev_resize_handler = signal.signal(signal.SIGWINCH, cls._on_resize)
+        except ValueError:
+            # Signal handlers can only be installed from the main thread
+            return
+        cls._resize_watched = True
+    
+    @classmethod
+    def _on_resize(cls, signum, frame) -> None:
+        """Refresh cached terminal width and chain to the previous handler."""
+        cls._term_width = cls._get_terminal_width()
+        if callable(cls._prev_resize_handler):
+            cls._prev_resize_handler(signum, frame)
+    
+    @classmethod
+    def _init_progress_fragments(cls) -> None:
+        """Precompute the static color fragments of the progress line."""
+        cls._PROG_PREFIX = f"\r{Fore.CYAN}[{Style.BRIGHT}"
+        cls._PROG_MID = f"{Style.RESET_ALL}{Fore.CYAN}] "
+        cls._PROG_SPEED = f"%{Style.RESET_ALL} {Fore.GREEN}"
+        cls._PROG_ETA = f"{Style.RESET_ALL} | {Fore.YELLOW}ETA: "
+        cls._PROG_SUFFIX = f"{Style.RESET_ALL}  "
     
     def print_header(self, text: str) -> None:
         """Print header."""
@@ -76,14 +154,24 @@ class CLIOutput:
         filename: str
     ) -> None:
         """Print download progress."""
-        bar_width = 30
-        filled = int(bar_width * percent / 100)
-        bar = '█' * filled + '░' * (bar_width - filled)
+        now = time.monotonic()
+        if now - self._last_progress < self.PROGRESS_INTERVAL and percent < 100:
+            return
+        self._last_progress = now
+        
+        filled = min(max(int(_BAR_WIDTH * percent / 100), 0), _BAR_WIDTH)
+        percent_str = f"{percent:.1f}"
         
-        progress = f"{Fore.CYAN}[{Style.BRIGHT}{bar}{Style.RESET_ALL}{Fore.CYAN}] {percent:.1f}%{Style.RESET_ALL}"
-        status = f"{Fore.GREEN}{speed}{Style.RESET_ALL} | {Fore.YELLOW}ETA: {eta}{Style.RESET_ALL}"
+        # Keep the line within the terminal so '\r' redraws don't wrap
+        used = _PROG_FIXED_WIDTH + len(percent_str) + len(speed) + len(eta)
+        filename = filename[:max(self._term_width - used - 1, 0)]
         
-        print(f"\r{progress} {status}  {filename}", end='\r', flush=True)
+        self._write(
+            f"{self._PROG_PREFIX}{_BARS[filled]}{self._PROG_MID}{percent_str}"
+            f"{self._PROG_SPEED}{speed}{self._PROG_ETA}{eta}"
+            f"{self._PROG_SUFFIX}{filename}\r"
+        )
+        self._stdout.flush()
     
     def print_download_complete(self, filepath: Path, filesize: str) -> None:
         """Print download complete message."""
@@ -3,10 +3,13 @@ Command-line argument parser.
 """
 
 import argparse
+import functools
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+
+from ..config.settings import Settings
 
 
 @dataclass
@@ -25,11 +28,28 @@ class CLIArgs:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            'url': self.url,
+            'bitrate': self.bitrate,
+            'output': self.output,
+            'proxy': self.proxy,
+            'proxy_file': self.proxy_file,
+            'verbose': self.verbose,
+            'list_formats': self.list_formats,
+            'no_metadata': self.no_metadata,
+            'normalize': self.normalize,
+            'ffmpeg_path': self.ffmpeg_path,
+        }
 
 
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
-    """Create argument parser."""
+    """
+    Create argument parser.
+    
+    The parser is built once and cached; repeated calls return the same
+    instance, so callers must not modify it.
+    """
     
     parser = argparse.ArgumentParser(
         description='YouTube MP3 Downloader - скачивание аудио с YouTube в формате MP3',
@@ -56,7 +76,7 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         '-b', '--bitrate',
         type=int,
-        choices=[128, 192, 320],
+        choices=sorted(Settings.VALID_BITRATES),
         default=192,
         help='Битрейт MP3 (128, 192, 320). По умолчанию: 192'
     )
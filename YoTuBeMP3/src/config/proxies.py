@@ -2,19 +2,81 @@
 Proxy manager for bypassing restrictions in Russia.
 """
 
+import asyncio
+import functools
 import random
-from typing import Dict, List, Optional
-import requests
-from requests.exceptions import ProxyError, Timeout, ConnectionError
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import aiohttp
+    import requests
+
+# Supported proxy URL schemes
+_SCHEMES = ('http://', 'https://', 'socks5://')
 
 
 class ProxyManager:
     """Manager for proxy servers."""
     
+    # Maximum number of proxies tested concurrently
+    MAX_TEST_WORKERS = 8
+    
+    # Proxies taken from the queue per round of concurrent tests; larger than
+    # MAX_TEST_WORKERS so probes that haven't started can still be cancelled
+    TEST_BATCH_SIZE = 32
+    
+    # Maximum number of simultaneous connections for async proxy tests
+    MAX_ASYNC_CONNECTIONS = 256
+    
+    # Bodyless endpoint used to check proxy liveness
+    TEST_URL = 'https://www.youtube.com/generate_204'
+    
     def __init__(self):
-        self.proxy_list: List[Dict[str, str]] = []
         self.current_proxy: Optional[Dict[str, str]] = None
-        self.used_proxies: set = set()
+        # Proxies not yet tried in the current rotation round
+        self._available: Deque[Dict[str, str]] = deque()
+        # Proxies already tried in the current rotation round
+        self._exhausted: Deque[Dict[str, str]] = deque()
+        self._lock = threading.Lock()
+        self._session: Optional['requests.Session'] = None
+    
+    def _get_session(self) -> 'requests.Session':
+        """
+        Get HTTP session with a connection pool shared by proxy tests.
+        
+        requests is imported here rather than at module level so that
+        startup paths which never test proxies don't pay for it.
+        
+        Returns:
+            Configured requests session
+        """
+        with self._lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+    
+    def _create_session(self) -> 'requests.Session':
+        """
+        Create HTTP session with a connection pool shared by proxy tests.
+        
+        Returns:
+            Configured requests session
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.MAX_TEST_WORKERS,
+            pool_maxsize=self.MAX_TEST_WORKERS,
+            max_retries=0
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
     
     def load_proxies(self, proxy_file: str) -> int:
         """
@@ -27,14 +89,18 @@ class ProxyManager:
             Number of loaded proxies
         """
         try:
-            with open(proxy_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        proxy = self._parse_proxy(line)
-                        if proxy:
-                            self.proxy_list.append(proxy)
-            return len(self.proxy_list)
+            with open(proxy_file, 'r', buffering=1 << 16) as f:
+                lines = (line.strip() for line in f)
+                loaded = [
+                    self._parse_proxy(line)
+                    for line in lines
+                    if line and not line.startswith('#')
+                ]
+            # Randomize once here instead of on every rotation
+            random.shuffle(loaded)
+            with self._lock:
+                self._available.extend(loaded)
+            return self.proxy_count()
         except FileNotFoundError:
             return 0
         except Exception:
@@ -50,7 +116,7 @@ class ProxyManager:
         Returns:
             Proxy dict or None if invalid
         """
-        if not proxy_str.startswith(('http://', 'https://', 'socks5://')):
+        if not proxy_str.startswith(_SCHEMES):
             proxy_str = 'http://' + proxy_str
         
         return {'http': proxy_str, 'https': proxy_str}
@@ -67,7 +133,8 @@ class ProxyManager:
         """
         proxy = self._parse_proxy(proxy_str)
         if proxy:
-            self.proxy_list.append(proxy)
+            with self._lock:
+                self._available.append(proxy)
             return True
         return False
     
@@ -82,23 +149,16 @@ class ProxyManager:
         Returns:
             True if proxy is working
         """
+        from requests.exceptions import ProxyError, Timeout, ConnectionError
+        
         try:
-            test_urls = [
-                'https://www.youtube.com',
-                'https://httpbin.org/ip',
-            ]
-            
-            for url in test_urls:
-                response = requests.get(
-                    url,
-                    proxies=proxy,
-                    timeout=timeout,
-                    allow_redirects=True
-                )
-                if response.status_code == 200:
-                    return True
-            
-            return False
+            response = self._get_session().head(
+                self.TEST_URL,
+                proxies=proxy,
+                timeout=timeout,
+                allow_redirects=False
+            )
+            return response.status_code < 400
         except (ProxyError, Timeout, ConnectionError):
             return False
         except Exception:
@@ -114,24 +174,200 @@ class ProxyManager:
         Returns:
             Working proxy dict or None
         """
-        available = [p for p in self.proxy_list if id(p) not in self.used_proxies]
+        with self._lock:
+            if not self._available:
+                # Start a new round once every proxy has been tried
+                self._available, self._exhausted = self._exhausted, self._available
+            pending = len(self._available)
         
-        if not available:
-            # Reset used proxies if all are used
-            if self.proxy_list:
-                available = self.proxy_list
-                self.used_proxies.clear()
+        while pending > 0:
+            with self._lock:
+                batch_size = min(self.TEST_BATCH_SIZE, len(self._available))
+                batch = [self._available.popleft() for _ in range(batch_size)]
+            
+            if not batch:
+                break
+            
+            pending -= len(batch)
+            proxy = self._test_batch(batch, timeout)
+            if proxy:
+                return proxy
         
-        random.shuffle(available)
+        return None
+    
+    def _test_batch(
+        self,
+        batch: List[Dict[str, str]],
+        timeout: int
+    ) -> Optional[Dict[str, str]]:
+        """
+        Test a batch of proxies concurrently and return the first working one.
         
-        for proxy in available:
-            if self.test_proxy(proxy, timeout):
-                self.current_proxy = proxy
-                self.used_proxies.add(id(proxy))
-                return proxy
+        Args:
+            batch: Proxies taken from the head of the available queue
+            timeout: Request timeout in seconds
+        
+        Returns:
+            Working proxy dict or None
+        """
+        executor = ThreadPoolExecutor(max_workers=min(len(batch), self.MAX_TEST_WORKERS))
+        futures = {
+            executor.submit(self.test_proxy, proxy, timeout): proxy
+            for proxy in batch
+        }
+        try:
+            for future in as_completed(futures):
+                proxy = futures.pop(future)
+                with self._lock:
+                    self._exhausted.append(proxy)
+                
+                if future.result():
+                    with self._lock:
+                        self.current_proxy = proxy
+                    return proxy
+        finally:
+            # Probes that haven't started go back to the head of the queue
+            # untested; running ones file their result when they finish
+            untested = []
+            for future, proxy in futures.items():
+                if future.cancel():
+                    untested.append(proxy)
+                else:
+                    future.add_done_callback(
+                        functools.partial(self._record_probe, proxy)
+                    )
+            with self._lock:
+                self._available.extendleft(reversed(untested))
+            # Don't wait for the running probes once a working proxy is found
+            executor.shutdown(wait=False)
         
         return None
     
+    def _record_probe(self, proxy: Dict[str, str], future: Future) -> None:
+        """
+        Put a proxy back into rotation once its background probe finishes.
+        
+        Args:
+            proxy: Tested proxy
+            future: Finished test_proxy future
+        """
+        with self._lock:
+            if future.result():
+                # Known to work, so offer it first on the next call
+                self._available.appendleft(proxy)
+            else:
+                self._exhausted.append(proxy)
+    
+    async def _probe(
+        self,
+        session: 'aiohttp.ClientSession',
+        proxy: Dict[str, str],
+        timeout: int
+    ) -> bool:
+        """
+        Test a single proxy with aiohttp.
+        
+        Args:
+            session: Shared aiohttp session
+            proxy: Proxy dict with 'http' and 'https' keys
+            timeout: Request timeout in seconds
+        
+        Returns:
+            True if proxy is working
+        """
+        import aiohttp
+        
+        # aiohttp only supports HTTP proxies
+        if proxy['http'].startswith('socks5://'):
+            return False
+        
+        try:
+            async with session.head(
+                self.TEST_URL,
+                proxy=proxy['http'],
+                timeout=aiohttp.ClientTimeout(total=timeout),
+                allow_redirects=False
+            ) as response:
+                return response.status < 400
+        except Exception:
+            return False
+    
+    async def test_proxies_async(
+        self,
+        proxies: List[Dict[str, str]],
+        timeout: int = 10
+    ) -> List[bool]:
+        """
+        Test many proxies concurrently on a single event loop.
+        
+        Requires the optional aiohttp package.
+        
+        Args:
+            proxies: Proxy dicts to test
+            timeout: Request timeout in seconds
+        
+        Returns:
+            Test results in the same order as proxies
+        """
+        import aiohttp
+        
+        connector = aiohttp.TCPConnector(limit=self.MAX_ASYNC_CONNECTIONS)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(
+                *(self._probe(session, proxy, timeout) for proxy in proxies)
+            )
+    
+    def get_working_proxy_async(self, timeout: int = 10) -> Optional[Dict[str, str]]:
+        """
+        Get a working proxy, testing the whole rotation round with aiohttp.
+        
+        Must not be called from a running event loop. Falls back to
+        get_working_proxy when the optional aiohttp package is missing.
+        
+        Args:
+            timeout: Request timeout in seconds
+        
+        Returns:
+            Working proxy dict or None
+        """
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            return self.get_working_proxy(timeout)
+        
+        with self._lock:
+            if not self._available:
+                # Start a new round once every proxy has been tried
+                self._available, self._exhausted = self._exhausted, self._available
+            candidates = list(self._available)
+            self._available.clear()
+        
+        if not candidates:
+            return None
+        
+        try:
+            results = asyncio.run(self.test_proxies_async(candidates, timeout))
+        except BaseException:
+            # Don't lose the pool if the run fails; requeue in original order
+            with self._lock:
+                self._available.extendleft(reversed(candidates))
+            raise
+        
+        working = None
+        with self._lock:
+            for proxy, ok in zip(candidates, results):
+                if working is None:
+                    self._exhausted.append(proxy)
+                    if ok:
+                        working = proxy
+                else:
+                    # Proxies after the chosen one stay in the current round
+                    self._available.append(proxy)
+            if working:
+                self.current_proxy = working
+        
+        return working
+    
     def rotate_proxy(self) -> Optional[Dict[str, str]]:
         """
         Rotate to next working proxy.
@@ -154,4 +390,8 @@ class ProxyManager:
     
     def has_proxies(self) -> bool:
         """Check if any proxies are loaded."""
-        return len(self.proxy_list) > 0
+        return self.proxy_count() > 0
+    
+    def proxy_count(self) -> int:
+        """Get number of loaded proxies."""
+        return len(self._available) + len(self._exhausted)
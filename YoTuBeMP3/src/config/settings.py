@@ -4,8 +4,8 @@ Configuration settings for YouTube MP3 Downloader.
 
 import os
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import Dict, Optional
+from dataclasses import dataclass
+from typing import ClassVar, FrozenSet, Optional
 
 
 @dataclass
@@ -13,11 +13,7 @@ class Settings:
     """Application settings."""
     
     # Supported bitrates
-    BITRATES: Dict[str, int] = field(default_factory=lambda: {
-        '128': 128,
-        '192': 192,
-        '320': 320
-    })
+    VALID_BITRATES: ClassVar[FrozenSet[int]] = frozenset((128, 192, 320))
     
     # Default format
     DEFAULT_FORMAT: str = 'mp3'
@@ -60,10 +56,10 @@ class Settings:
         """Get bitrate value, fallback to default."""
         if bitrate is None:
             return self.default_bitrate
-        if bitrate in self.BITRATES.values():
+        if bitrate in self.VALID_BITRATES:
             return bitrate
         return self.default_bitrate
     
     def validate_bitrate(self, bitrate: int) -> bool:
         """Validate bitrate value."""
-        return bitrate in self.BITRATES.values()
+        return bitrate in self.VALID_BITRATES
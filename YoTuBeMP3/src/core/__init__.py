@@ -1,12 +1,13 @@
 """Core module for downloading and converting audio."""
 
-from .downloader import YouTubeDownloader, DownloadProgress
+from .downloader import YouTubeDownloader, DownloadProgress, YT_URL_RE
 from .converter import AudioConverter
 from .metadata import AudioMetadata
 
 __all__ = [
     "YouTubeDownloader",
     "DownloadProgress",
+    "YT_URL_RE",
     "AudioConverter",
     "AudioMetadata",
 ]
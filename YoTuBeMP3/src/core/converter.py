@@ -2,40 +2,24 @@
 Audio converter using FFmpeg.
 """
 
-import subprocess
 import json
+import logging
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple
 
+try:
+    # orjson parses bytes directly and is considerably faster than json
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
-@dataclass
-class AudioMetadata:
-    """Audio file metadata."""
-    title: Optional[str] = None
-    artist: Optional[str] = None
-    album: Optional[str] = None
-    genre: Optional[str] = None
-    year: Optional[int] = None
-    track: Optional[str] = None
-    cover: Optional[Path] = None
-    
-    def to_dict(self) -> Dict[str, str]:
-        """Convert to dictionary for FFmpeg."""
-        result = {}
-        if self.title:
-            result['title'] = self.title
-        if self.artist:
-            result['artist'] = self.artist
-        if self.album:
-            result['album'] = self.album
-        if self.genre:
-            result['genre'] = self.genre
-        if self.year:
-            result['year'] = str(self.year)
-        if self.track:
-            result['track'] = self.track
-        return result
+from .metadata import AudioMetadata
+
+logger = logging.getLogger('youtube_mp3_downloader.converter')
 
 
 class AudioConverter:
@@ -46,8 +30,56 @@ class AudioConverter:
         ffmpeg_path: Path to ffmpeg executable
     """
     
+    # Only errors are printed; progress stats would just fill the pipe
+    QUIET_ARGS = ('-hide_banner', '-loglevel', 'error', '-nostats')
+    
     def __init__(self, ffmpeg_path: str = 'ffmpeg'):
         self.ffmpeg_path = ffmpeg_path
+        # (ffmpeg_path, version) of the last `ffmpeg -version` call
+        self._version_cache: Optional[Tuple[str, Optional[str]]] = None
+        # MP3 encoder arguments by bitrate
+        self._argv_cache: Dict[int, Tuple[str, ...]] = {}
+    
+    def invalidate_cache(self) -> None:
+        """Forget the cached FFmpeg version so the next check runs FFmpeg again."""
+        self._version_cache = None
+    
+    def _encoder_args(self, bitrate: int) -> Tuple[str, ...]:
+        """
+        Get FFmpeg MP3 encoder arguments for a bitrate.
+        
+        Args:
+            bitrate: Audio bitrate
+        
+        Returns:
+            Tuple of FFmpeg arguments
+        """
+        args = self._argv_cache.get(bitrate)
+        if args is None:
+            args = ('-codec:a', 'libmp3lame', '-b:a', f'{bitrate}k', '-q:a', '2')
+            self._argv_cache[bitrate] = args
+        return args
+    
+    @staticmethod
+    def _succeeded(result: subprocess.CompletedProcess) -> bool:
+        """
+        Check an FFmpeg run, logging its error output on failure.
+        
+        Args:
+            result: Finished FFmpeg process with stderr captured as bytes
+        
+        Returns:
+            True if FFmpeg exited successfully
+        """
+        if result.returncode == 0:
+            return True
+        
+        logger.warning(
+            "FFmpeg exited with code %d: %s",
+            result.returncode,
+            result.stderr.decode(errors='replace').strip()
+        )
+        return False
     
     def check_ffmpeg(self) -> bool:
         """
@@ -56,21 +88,28 @@ class AudioConverter:
         Returns:
             True if FFmpeg is installed
         """
-        try:
-            result = subprocess.run(
-                [self.ffmpeg_path, '-version'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            return result.returncode == 0
-        except (subprocess.SubprocessError, FileNotFoundError):
-            return False
+        return self.get_ffmpeg_version() is not None
     
     def get_ffmpeg_version(self) -> Optional[str]:
         """
         Get FFmpeg version.
         
+        The result is cached per ffmpeg_path for the lifetime of the converter.
+        
+        Returns:
+            Version string or None
+        """
+        if self._version_cache is not None and self._version_cache[0] == self.ffmpeg_path:
+            return self._version_cache[1]
+        
+        version = self._read_ffmpeg_version()
+        self._version_cache = (self.ffmpeg_path, version)
+        return version
+    
+    def _read_ffmpeg_version(self) -> Optional[str]:
+        """
+        Run `ffmpeg -version` and return its first line.
+        
         Returns:
             Version string or None
         """
@@ -109,21 +148,23 @@ class AudioConverter:
         Returns:
             True if conversion successful
         """
-        input_file = Path(input_file)
-        output_file = Path(output_file)
+        # subprocess accepts plain strings, so skip building Path objects
+        input_str = os.fspath(input_file)
+        output_str = os.fspath(output_file)
         
-        if not input_file.exists():
-            raise FileNotFoundError(f"Input file not found: {input_file}")
+        if not os.path.exists(input_str):
+            raise FileNotFoundError(f"Input file not found: {input_str}")
         
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_dir = os.path.dirname(output_str)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
         
         cmd = [
             self.ffmpeg_path,
+            *self.QUIET_ARGS,
             '-y' if overwrite else '-n',
-            '-i', str(input_file),
-            '-codec:a', 'libmp3lame',
-            f'-b:a', f'{bitrate}k',
-            '-q:a', '2',
+            '-i', input_str,
+            *self._encoder_args(bitrate),
         ]
         
         # Add metadata
@@ -132,21 +173,243 @@ class AudioConverter:
             for key, value in metadata_dict.items():
                 cmd.extend(['-metadata', f'{key}={value}'])
         
+        cmd.append(output_str)
+        
+        try:
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=600  # 10 minutes timeout
+            )
+            return self._succeeded(result)
+        except subprocess.TimeoutExpired:
+            raise TimeoutError("FFmpeg conversion timed out")
+        except subprocess.SubprocessError as e:
+            raise RuntimeError(f"FFmpeg error: {e}")
+    
+    def convert_bytes_to_mp3(
+        self,
+        data: bytes,
+        output_file: Path,
+        bitrate: int = 192,
+        metadata: Optional[AudioMetadata] = None,
+        overwrite: bool = False
+    ) -> bool:
+        """
+        Convert in-memory audio to MP3, feeding FFmpeg through stdin.
+        
+        Avoids writing the source to a temporary file when the caller
+        already holds the downloaded bytes. stdin is not seekable, so
+        MP4/M4A data (whose index may sit at the end of the file) is
+        still spilled to a temporary file and converted from there.
+        
+        Args:
+            data: Source audio/video bytes
+            output_file: Output MP3 file path
+            bitrate: Audio bitrate (128, 192, 320)
+            metadata: Audio metadata to add
+            overwrite: Whether to overwrite output file
+        
+        Returns:
+            True if conversion successful
+        """
+        # ISO base media files (mp4, m4a) start with a size and 'ftyp' box
+        if data[4:8] == b'ftyp':
+            return self._convert_via_temp_file(
+                data, output_file, bitrate, metadata, overwrite
+            )
+        
+        output_file = Path(output_file)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        cmd = [
+            self.ffmpeg_path,
+            *self.QUIET_ARGS,
+            '-y' if overwrite else '-n',
+            '-i', 'pipe:0',
+            *self._encoder_args(bitrate),
+        ]
+        
+        # Add metadata
+        if metadata:
+            for key, value in metadata.to_dict().items():
+                cmd.extend(['-metadata', f'{key}={value}'])
+        
         cmd.append(str(output_file))
         
         try:
             result = subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                input=data,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=600  # 10 minutes timeout
             )
-            return result.returncode == 0
+            return self._succeeded(result)
+        except subprocess.TimeoutExpired:
+            raise TimeoutError("FFmpeg conversion timed out")
+        except subprocess.SubprocessError as e:
+            raise RuntimeError(f"FFmpeg error: {e}")
+    
+    def _convert_via_temp_file(
+        self,
+        data: bytes,
+        output_file: Path,
+        bitrate: int,
+        metadata: Optional[AudioMetadata],
+        overwrite: bool
+    ) -> bool:
+        """
+        Convert in-memory audio that FFmpeg must be able to seek in.
+        
+        Args:
+            data: Source audio/video bytes
+            output_file: Output MP3 file path
+            bitrate: Audio bitrate (128, 192, 320)
+            metadata: Audio metadata to add
+            overwrite: Whether to overwrite output file
+        
+        Returns:
+            True if conversion successful
+        """
+        fd, temp_path = tempfile.mkstemp(suffix='.m4a')
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                temp_file.write(data)
+            return self.convert_to_mp3(temp_path, output_file, bitrate, metadata, overwrite)
+        finally:
+            os.remove(temp_path)
+    
+    def convert_many(
+        self,
+        jobs: List[Tuple[Path, Path, int, Optional[AudioMetadata]]],
+        overwrite: bool = False
+    ) -> bool:
+        """
+        Convert several files to MP3 with a single FFmpeg process.
+        
+        Every job becomes its own input and mapped output, so the process
+        startup cost is paid once for the whole batch. The result is
+        all-or-nothing: if FFmpeg fails on any job, the whole batch fails
+        and outputs may be incomplete. That includes an input without audio,
+        since FFmpeg refuses to write an output with no streams. Use
+        convert_batch for per-job results.
+        
+        Args:
+            jobs: List of (input_file, output_file, bitrate, metadata) tuples
+            overwrite: Whether to overwrite output files
+        
+        Returns:
+            True if all conversions successful; False if FFmpeg failed or,
+            without overwrite, some outputs already existed (those jobs are
+            skipped and logged, the others are still converted)
+        """
+        if not jobs:
+            return True
+        
+        pending = []
+        for input_file, output_file, bitrate, metadata in jobs:
+            input_str = os.fspath(input_file)
+            output_str = os.fspath(output_file)
+            
+            if not os.path.exists(input_str):
+                raise FileNotFoundError(f"Input file not found: {input_str}")
+            
+            # With -n one existing output would make FFmpeg abort every job
+            if not overwrite and os.path.exists(output_str):
+                logger.warning("Skipping conversion, output exists: %s", output_str)
+                continue
+            
+            pending.append((input_str, output_str, bitrate, metadata))
+        
+        if not pending:
+            return False
+        
+        cmd = [self.ffmpeg_path, *self.QUIET_ARGS, '-y' if overwrite else '-n']
+        
+        for input_str, _, _, _ in pending:
+            cmd.extend(['-i', input_str])
+        
+        for index, (_, output_str, bitrate, metadata) in enumerate(pending):
+            output_dir = os.path.dirname(output_str)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            
+            # Take metadata and chapters from this job's own input; by default
+            # FFmpeg copies them from input 0 into every output. The '?' makes
+            # a missing audio stream optional when mapping
+            cmd.extend([
+                '-map', f'{index}:a?',
+                '-map_metadata', str(index),
+                '-map_chapters', str(index),
+                *self._encoder_args(bitrate)
+            ])
+            
+            # Metadata placed before an output file applies to that output only
+            if metadata:
+                for key, value in metadata.to_dict().items():
+                    cmd.extend(['-metadata', f'{key}={value}'])
+            
+            cmd.append(output_str)
+        
+        try:
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=600 * len(pending)  # 10 minutes per file
+            )
+            return self._succeeded(result) and len(pending) == len(jobs)
         except subprocess.TimeoutExpired:
             raise TimeoutError("FFmpeg conversion timed out")
         except subprocess.SubprocessError as e:
             raise RuntimeError(f"FFmpeg error: {e}")
     
+    def convert_batch(
+        self,
+        jobs: List[Tuple[Path, Path, int, Optional[AudioMetadata]]],
+        workers: Optional[int] = None,
+        overwrite: bool = False
+    ) -> List[bool]:
+        """
+        Convert several files to MP3 in parallel FFmpeg processes.
+        
+        Args:
+            jobs: List of (input_file, output_file, bitrate, metadata) tuples
+            workers: Number of parallel conversions (defaults to CPU count)
+            overwrite: Whether to overwrite output files
+        
+        Returns:
+            Conversion results in the same order as jobs
+        """
+        results = [False] * len(jobs)
+        if not jobs:
+            return results
+        
+        max_workers = min(workers or os.cpu_count() or 1, len(jobs))
+        
+        # FFmpeg does the work in child processes, so threads are enough here
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.convert_to_mp3,
+                    input_file,
+                    output_file,
+                    bitrate,
+                    metadata,
+                    overwrite
+                ): index
+                for index, (input_file, output_file, bitrate, metadata) in enumerate(jobs)
+            }
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception:
+                    results[futures[future]] = False
+        
+        return results
+    
     def extract_audio(
         self,
         video_file: Path,
@@ -189,17 +452,46 @@ class AudioConverter:
                     str(audio_file)
                 ],
                 capture_output=True,
-                text=True,
                 timeout=30
             )
             
             if result.returncode == 0:
-                return json.loads(result.stdout)
+                return _json_loads(result.stdout)
         except (subprocess.SubprocessError, FileNotFoundError, json.JSONDecodeError):
             pass
         
         return {}
     
+    def get_audio_duration(self, audio_file: Path) -> Optional[float]:
+        """
+        Get audio duration using ffprobe, without the full JSON report.
+        
+        Args:
+            audio_file: Path to audio file
+        
+        Returns:
+            Duration in seconds or None
+        """
+        try:
+            result = subprocess.run(
+                [
+                    'ffprobe',
+                    '-v', 'error',
+                    '-show_entries', 'format=duration',
+                    '-of', 'csv=p=0',
+                    os.fspath(audio_file)
+                ],
+                capture_output=True,
+                timeout=30
+            )
+            
+            if result.returncode == 0:
+                return float(result.stdout)
+        except (subprocess.SubprocessError, FileNotFoundError, ValueError):
+            pass
+        
+        return None
+    
     def normalize_audio(
         self,
         input_file: Path,
@@ -219,6 +511,7 @@ class AudioConverter:
         """
         cmd = [
             self.ffmpeg_path,
+            *self.QUIET_ARGS,
             '-y',
             '-i', str(input_file),
             '-af', f'loudnorm=I={target_level}:TP=-1.5:LRA=11',
@@ -230,11 +523,11 @@ class AudioConverter:
         try:
             result = subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=300
             )
-            return result.returncode == 0
+            return self._succeeded(result)
         except (subprocess.SubprocessError, TimeoutError):
             return False
     
@@ -254,9 +547,8 @@ class AudioConverter:
         Returns:
             Formatted duration string
         """
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
+        hours, remainder = divmod(seconds, 3600)
+        minutes, secs = divmod(remainder, 60)
         
         if hours > 0:
             return f"{hours}:{minutes:02d}:{secs:02d}"
@@ -2,13 +2,17 @@
 YouTube audio downloader using yt-dlp.
 """
 
+import functools
+import logging
 import os
 import re
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, Optional, Any
+from typing import Callable, Dict, Iterable, List, Optional, Any, Tuple
 
 from yt_dlp import YoutubeDL, DownloadError
 from yt_dlp.utils import ExtractorError
@@ -16,6 +20,15 @@ from yt_dlp.utils import ExtractorError
 from ..config.settings import Settings
 from ..config.proxies import ProxyManager
 
+logger = logging.getLogger('youtube_mp3_downloader.downloader')
+
+
+# YouTube URL pattern used by YouTubeDownloader.validate_url
+YT_URL_RE = re.compile(
+    r'^(?:https?://)?(?:www\.)?(?:youtube\.com|youtu\.?be)/.+$',
+    re.ASCII
+)
+
 
 @dataclass
 class DownloadProgress:
@@ -42,8 +55,7 @@ class VideoInfo:
     @property
     def duration_str(self) -> str:
         """Get duration as string."""
-        minutes = self.duration // 60
-        seconds = self.duration % 60
+        minutes, seconds = divmod(self.duration, 60)
         return f"{minutes}:{seconds:02d}"
 
 
@@ -64,7 +76,75 @@ class YouTubeDownloader:
         self.settings = settings or Settings.from_env()
         self.proxy_manager = proxy_manager or ProxyManager()
         self.progress_hook: Optional[Callable[[Dict[str, Any]], None]] = None
-        self._ydl = None
+        # YoutubeDL instances are reused between calls; each thread keeps its
+        # own cache because YoutubeDL is not thread-safe
+        self._ydl_local = threading.local()
+        # Every thread's cache by thread ident, so other threads can close them
+        self._ydl_caches: Dict[int, Dict[Tuple[Any, ...], YoutubeDL]] = {}
+        self._ydl_lock = threading.Lock()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    def close(self) -> None:
+        """Close all cached yt-dlp instances."""
+        with self._ydl_lock:
+            caches = list(self._ydl_caches.values())
+            self._ydl_caches.clear()
+            self._ydl_local = threading.local()
+            for cache in caches:
+                for ydl in cache.values():
+                    ydl.close()
+    
+    def _close_thread_ydls(self, thread_ids: Iterable[int]) -> None:
+        """
+        Close yt-dlp instances cached by the given threads.
+        
+        Args:
+            thread_ids: Idents of threads that no longer download
+        """
+        with self._ydl_lock:
+            for thread_id in thread_ids:
+                for ydl in self._ydl_caches.pop(thread_id, {}).values():
+                    ydl.close()
+    
+    def _get_ydl(
+        self,
+        key: Tuple[Any, ...],
+        build_options: Callable[[], Dict[str, Any]]
+    ) -> YoutubeDL:
+        """
+        Get cached yt-dlp instance, creating it on first use.
+        
+        Reusing the instance keeps initialized extractors between calls.
+        
+        Args:
+            key: Cache key describing the options
+            build_options: Function returning yt-dlp options for a new instance
+        
+        Returns:
+            YoutubeDL instance for the current thread
+        """
+        cache = getattr(self._ydl_local, 'cache', None)
+        if cache is None:
+            cache = self._ydl_local.cache = {}
+            with self._ydl_lock:
+                self._ydl_caches[threading.get_ident()] = cache
+        
+        # Options depend on the current proxy, so it is part of the key
+        proxy = self.proxy_manager.get_proxy_string()
+        key = key + (proxy,)
+        ydl = cache.get(key)
+        if ydl is None:
+            with self._ydl_lock:
+                # Instances for a proxy that was rotated away won't be used again
+                for stale_key in [k for k in cache if k[-1] != proxy]:
+                    cache.pop(stale_key).close()
+                ydl = cache[key] = YoutubeDL(build_options())
+        return ydl
     
     def _get_ytdl_options(self, bitrate: int = 192) -> Dict[str, Any]:
         """
@@ -116,6 +196,8 @@ class YouTubeDownloader:
             hook: Callback function
         """
         self.progress_hook = hook
+        # Cached instances were created with the previous hook
+        self.close()
     
     def get_video_info(self, url: str) -> VideoInfo:
         """
@@ -127,27 +209,25 @@ class YouTubeDownloader:
         Returns:
             VideoInfo object
         """
-        ydl_opts = self._get_ytdl_options()
-        ydl_opts['quiet'] = True
-        ydl_opts['simulate'] = True
+        def build_options() -> Dict[str, Any]:
+            ydl_opts = self._get_ytdl_options()
+            ydl_opts['quiet'] = True
+            ydl_opts['simulate'] = True
+            return ydl_opts
         
-        proxy = self.proxy_manager.get_proxy_string()
-        if proxy:
-            ydl_opts['proxy'] = proxy
+        ydl = self._get_ydl(('info',), build_options)
+        info = ydl.extract_info(url, download=False)
         
-        with YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            
-            return VideoInfo(
-                title=info.get('title', 'Unknown'),
-                url=url,
-                duration=info.get('duration', 0),
-                thumbnail=info.get('thumbnail', ''),
-                uploader=info.get('uploader', 'Unknown'),
-                view_count=info.get('view_count', 0),
-                like_count=info.get('like_count', 0),
-                formats=info.get('formats', [])
-            )
+        return VideoInfo(
+            title=info.get('title', 'Unknown'),
+            url=url,
+            duration=info.get('duration', 0),
+            thumbnail=info.get('thumbnail', ''),
+            uploader=info.get('uploader', 'Unknown'),
+            view_count=info.get('view_count', 0),
+            like_count=info.get('like_count', 0),
+            formats=info.get('formats', [])
+        )
     
     def download(
         self,
@@ -174,33 +254,100 @@ class YouTubeDownloader:
         if not self.settings.validate_bitrate(bitrate):
             bitrate = self.settings.default_bitrate
         
-        ydl_opts = self._get_ytdl_options(bitrate)
-        ydl_opts['outtmpl'] = str(output_path / '%(title)s.%(ext)s')
-        
-        proxy = self.proxy_manager.get_proxy_string()
-        if proxy:
-            ydl_opts['proxy'] = proxy
-        
-        # Add metadata postprocessor
-        if add_metadata:
-            ydl_opts['postprocessors'].append({
-                'key': 'MetadataParser',
-                'actions': [
-                    ('title', None, '%(title)s'),
-                    ('artist', None, '%(uploader)s'),
-                    ('album', None, 'YouTube'),
-                ],
-            })
-        
-        with YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=True)
+        def build_options() -> Dict[str, Any]:
+            ydl_opts = self._get_ytdl_options(bitrate)
             
-            # Get the downloaded file path
-            filename = ydl.prepare_filename(info)
-            base_name = os.path.splitext(filename)[0]
-            mp3_path = Path(f"{base_name}.mp3")
+            # Add metadata postprocessor
+            if add_metadata:
+                ydl_opts['postprocessors'].append({
+                    'key': 'MetadataParser',
+                    'actions': [
+                        ('title', None, '%(title)s'),
+                        ('artist', None, '%(uploader)s'),
+                        ('album', None, 'YouTube'),
+                    ],
+                })
             
-            return mp3_path
+            # Postprocessors report the final file path
+            ydl_opts['postprocessor_hooks'] = [self._postprocessor_hook]
+            return ydl_opts
+        
+        ydl = self._get_ydl(('download', bitrate, add_metadata), build_options)
+        # Output directory may differ between calls on the same instance
+        ydl.params['outtmpl']['default'] = str(output_path / '%(title)s.%(ext)s')
+        
+        self._ydl_local.final_path = None
+        info = ydl.extract_info(url, download=True)
+        
+        if self._ydl_local.final_path:
+            return Path(self._ydl_local.final_path)
+        
+        # No postprocessor ran: derive the path from the output template
+        filename = ydl.prepare_filename(info)
+        base_name = os.path.splitext(filename)[0]
+        mp3_path = Path(f"{base_name}.mp3")
+        
+        return mp3_path
+    
+    def _postprocessor_hook(self, data: Dict[str, Any]) -> None:
+        """
+        Remember the file path reported by a finished postprocessor.
+        
+        Args:
+            data: yt-dlp postprocessor hook data
+        """
+        if data.get('status') == 'finished':
+            filepath = data.get('info_dict', {}).get('filepath')
+            if filepath:
+                self._ydl_local.final_path = filepath
+    
+    def download_many(
+        self,
+        urls: List[str],
+        output_path: Path,
+        bitrate: int = 192,
+        workers: Optional[int] = None
+    ) -> List[Optional[Path]]:
+        """
+        Download several videos concurrently.
+        
+        Args:
+            urls: YouTube video URLs
+            output_path: Output directory path
+            bitrate: Audio bitrate (128, 192, 320)
+            workers: Number of parallel downloads (defaults to min(32, len(urls)))
+        
+        Returns:
+            Paths to downloaded MP3 files in the same order as urls,
+            None for failed downloads
+        """
+        results: List[Optional[Path]] = [None] * len(urls)
+        if not urls:
+            return results
+        
+        max_workers = min(workers or 32, len(urls))
+        worker_ids = set()
+        
+        def download_in_worker(url: str) -> Path:
+            worker_ids.add(threading.get_ident())
+            return self.download(url, output_path, bitrate)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(download_in_worker, url): index
+                    for index, url in enumerate(urls)
+                }
+                for future in as_completed(futures):
+                    try:
+                        results[futures[future]] = future.result()
+                    except Exception:
+                        results[futures[future]] = None
+        finally:
+            # Worker threads are gone, so nothing will reuse their instances
+            self._close_thread_ydls(worker_ids)
+        
+        return results
     
     def download_with_retry(
         self,
@@ -266,6 +413,7 @@ class YouTubeDownloader:
         # Build command
         cmd = [
             sys.executable, '-m', 'yt_dlp',
+            '--quiet', '--no-progress',
             '-f', 'bestaudio[ext=webm]',
             '--extract-audio',
             '--audio-format', 'mp3',
@@ -283,26 +431,58 @@ class YouTubeDownloader:
         try:
             result = subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=600
             )
             
             if result.returncode == 0:
                 # Find the downloaded MP3 file
-                for f in output_path.glob('*.mp3'):
-                    return f
+                return self._find_file_by_extension(output_path, ('.mp3',))
             else:
+                logger.warning(
+                    "yt-dlp exited with code %d: %s",
+                    result.returncode,
+                    result.stderr.decode(errors='replace').strip()
+                )
                 # Try to find any file that might have been created
-                for f in output_path.glob('*'):
-                    if f.suffix.lower() in ['.mp3', '.webm', '.m4a']:
-                        return f
+                return self._find_file_by_extension(
+                    output_path, ('.mp3', '.webm', '.m4a'), ignore_case=True
+                )
         except Exception:
             pass
         
         return None
     
     @staticmethod
+    def _find_file_by_extension(
+        directory: Path,
+        extensions: Tuple[str, ...],
+        ignore_case: bool = False
+    ) -> Optional[Path]:
+        """
+        Find first directory entry with one of the given extensions.
+        
+        Uses os.scandir so non-matching entries cost neither a stat call
+        nor a Path object.
+        
+        Args:
+            directory: Directory to search
+            extensions: Accepted extensions (lowercase, with leading dot)
+            ignore_case: Compare extensions case-insensitively
+        
+        Returns:
+            Path to matching file or None
+        """
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name.lower() if ignore_case else entry.name
+                if name.endswith(extensions):
+                    return Path(entry.path)
+        return None
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def validate_url(url: str) -> bool:
         """
         Validate YouTube URL.
@@ -313,5 +493,4 @@ class YouTubeDownloader:
         Returns:
             True if valid YouTube URL
         """
-        youtube_regex = r'^(https?://)?(www\.)?(youtube\.com|youtu\.?be)/.+$'
-        return bool(re.match(youtube_regex, url))
+        return YT_URL_RE.match(url) is not None
@@ -2,10 +2,26 @@
 Metadata handling for audio files.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Dict, Optional
 
 
+# Metadata field name -> FFmpeg metadata key
+FFMPEG_KEYS = {
+    'title': 'title',
+    'artist': 'artist',
+    'album': 'album',
+    'album_artist': 'album_artist',
+    'genre': 'genre',
+    'year': 'date',
+    'track': 'track',
+    'disc_number': 'disc',
+    'comment': 'comment',
+    'copyright': 'copyright',
+    'encoded_by': 'encoded_by',
+}
+
+
 @dataclass
 class AudioMetadata:
     """Audio file metadata."""
@@ -47,24 +63,8 @@ class AudioMetadata:
     
     def to_dict(self) -> Dict[str, str]:
         """Convert to dictionary for FFmpeg."""
-        result = {}
-        mapping = {
-            'title': 'title',
-            'artist': 'artist',
-            'album': 'album',
-            'album_artist': 'album_artist',
-            'genre': 'genre',
-            'year': 'date',
-            'track': 'track',
-            'disc_number': 'disc',
-            'comment': 'comment',
-            'copyright': 'copyright',
-            'encoded_by': 'encoded_by',
+        return {
+            FFMPEG_KEYS[f.name]: str(value)
+            for f in fields(self)
+            if f.name in FFMPEG_KEYS and (value := getattr(self, f.name))
         }
-        
-        for field, key in mapping.items():
-            value = getattr(self, field, None)
-            if value:
-                result[key] = str(value)
-        
-        return result
@@ -2,10 +2,13 @@
 Logging utilities.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from datetime import datetime
 
 
@@ -15,6 +18,15 @@ class LoggingUtils:
     LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
     
+    # Set once handlers are attached; later calls only adjust levels
+    _configured: bool = False
+    
+    # Name prefix used to recognise the file handler on repeated calls
+    FILE_HANDLER_PREFIX = 'file:'
+    
+    # Background listeners writing queued records to log files, by handler name
+    _listeners: Dict[str, QueueListener] = {}
+    
     @staticmethod
     def setup_logging(
         level: str = 'INFO',
@@ -42,31 +54,95 @@ class LoggingUtils:
         logger = logging.getLogger('youtube_mp3_downloader')
         logger.setLevel(log_level)
         
+        if LoggingUtils._configured:
+            # Already set up: just update levels and the file handler
+            for handler in logger.handlers:
+                handler.setLevel(log_level)
+            if log_file:
+                LoggingUtils._set_file_handler(logger, log_file, log_level)
+            return logger
+        
         # Remove existing handlers
         logger.handlers.clear()
         
-        # Create formatter
-        formatter = logging.Formatter(
-            LoggingUtils.LOG_FORMAT,
-            LoggingUtils.DATE_FORMAT
-        )
-        
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(log_level)
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(LoggingUtils._get_formatter())
         logger.addHandler(console_handler)
         
         # File handler
         if log_file:
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
-            file_handler.setLevel(log_level)
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            LoggingUtils._set_file_handler(logger, log_file, log_level)
         
+        LoggingUtils._configured = True
         return logger
     
+    @staticmethod
+    def _get_formatter() -> logging.Formatter:
+        """Create log formatter."""
+        return logging.Formatter(
+            LoggingUtils.LOG_FORMAT,
+            LoggingUtils.DATE_FORMAT
+        )
+    
+    @staticmethod
+    def _set_file_handler(logger: logging.Logger, log_file: Path, log_level: int) -> None:
+        """
+        Attach file handler for log_file, replacing a handler for another file.
+        
+        The logger only gets a QueueHandler; the actual FileHandler runs in a
+        QueueListener thread so file I/O stays off the calling thread.
+        
+        Args:
+            logger: Logger instance
+            log_file: Path to log file
+            log_level: Handler log level
+        """
+        name = f"{LoggingUtils.FILE_HANDLER_PREFIX}{log_file}"
+        
+        for handler in list(logger.handlers):
+            if handler.name == name:
+                return
+            if handler.name and handler.name.startswith(LoggingUtils.FILE_HANDLER_PREFIX):
+                logger.removeHandler(handler)
+                LoggingUtils._stop_listener(handler.name)
+        
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler.setFormatter(LoggingUtils._get_formatter())
+        
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, file_handler)
+        listener.start()
+        
+        LoggingUtils._listeners[name] = listener
+        
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.set_name(name)
+        queue_handler.setLevel(log_level)
+        logger.addHandler(queue_handler)
+    
+    @staticmethod
+    def _stop_listener(name: str) -> None:
+        """
+        Flush and stop the listener for a file handler, closing its file.
+        
+        Args:
+            name: File handler name
+        """
+        listener = LoggingUtils._listeners.pop(name, None)
+        if listener:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+    
+    @staticmethod
+    def stop_listeners() -> None:
+        """Flush queued log records and stop all background file writers."""
+        for name in list(LoggingUtils._listeners):
+            LoggingUtils._stop_listener(name)
+    
     @staticmethod
     def get_log_filename() -> Path:
         """
@@ -90,3 +166,7 @@ class LoggingUtils:
         """
         logger.error(f"{message}: {exc}")
         logger.debug("Exception traceback:", exc_info=True)
+
+
+# Make sure queued records reach the log file before the interpreter exits
+atexit.register(LoggingUtils.stop_listeners)
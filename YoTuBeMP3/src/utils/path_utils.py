@@ -2,16 +2,31 @@
 Path manipulation utilities.
 """
 
+import glob
 import os
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
 
 
 class PathUtils:
     """Path manipulation utilities."""
     
-    INVALID_FILENAME_CHARS = r'<>:"/\\|?*\0'
+    INVALID_FILENAME_CHARS = '<>:"/\\|?*\0'
+    
+    # Translation table: control characters are dropped, invalid ones replaced
+    _FILENAME_TRANS = str.maketrans({
+        **{chr(i): None for i in range(32)},
+        **{c: '_' for c in INVALID_FILENAME_CHARS},
+    })
+    
+    # Any character that sanitize_filename would replace or drop
+    _BAD_FILENAME_RE = re.compile(f'[{re.escape(INVALID_FILENAME_CHARS)}\x00-\x1f]')
+    
+    SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+    
+    # Directories already created by ensure_directory in this process
+    _ensured: Set[str] = set()
     
     @staticmethod
     def sanitize_filename(filename: str, max_length: int = 255) -> str:
@@ -25,13 +40,18 @@ class PathUtils:
         Returns:
             Sanitized filename
         """
-        # Replace invalid characters
-        result = filename
-        for char in PathUtils.INVALID_FILENAME_CHARS:
-            result = result.replace(char, '_')
+        # Fast path: most titles are already valid and need no new string
+        if (
+            filename
+            and len(filename) <= max_length
+            and not filename[0].isspace()
+            and not filename[-1].isspace()
+            and not PathUtils._BAD_FILENAME_RE.search(filename)
+        ):
+            return filename
         
-        # Remove control characters
-        result = ''.join(c for c in result if ord(c) >= 32)
+        # Replace invalid characters and remove control characters in one pass
+        result = filename.translate(PathUtils._FILENAME_TRANS)
         
         # Trim whitespace
         result = result.strip()
@@ -77,26 +97,32 @@ class PathUtils:
         Returns:
             Formatted size string
         """
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024
-        
-        return f"{size_bytes:.2f} TB"
+        # Each unit step is 2**10, so the bit length gives the unit directly
+        index = min(
+            (max(int(size_bytes), 1).bit_length() - 1) // 10,
+            len(PathUtils.SIZE_UNITS) - 1
+        )
+        return f"{size_bytes / (1 << (index * 10)):.2f} {PathUtils.SIZE_UNITS[index]}"
     
     @staticmethod
     def ensure_directory(path: Path) -> Path:
         """
         Ensure directory exists.
         
+        Directories are remembered after the first call, so repeated calls
+        for the same path skip the filesystem.
+        
         Args:
             path: Directory path
         
         Returns:
             Path object
         """
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        key = os.fspath(path)
+        if key not in PathUtils._ensured:
+            Path(key).mkdir(parents=True, exist_ok=True)
+            PathUtils._ensured.add(key)
+        return Path(path)
     
     @staticmethod
     def find_file(directory: Path, filename: str) -> Optional[Path]:
@@ -111,13 +137,11 @@ class PathUtils:
             Path to file or None
         """
         try:
-            for root, dirs, files in os.walk(directory):
-                if filename in files:
-                    return Path(root) / filename
+            # Escape the name so titles with '[' or '*' aren't treated as patterns
+            matches = Path(directory).rglob(glob.escape(filename))
+            return next((path for path in matches if path.is_file()), None)
         except OSError:
-            pass
-        
-        return None
+            return None
     
     @staticmethod
     def get_unique_path(path: Path) -> Path:
@@ -2,112 +2,232 @@
 URL validation utilities.
 """
 
+import functools
 import re
-from typing import List, Optional
+import string
+from typing import AnyStr, Iterable, List, Optional
 
+# YouTube URL patterns
+YOUTUBE_PATTERNS = [
+    r'^https?://(?:www\.)?youtube\.com/watch\?v=[\w-]+',
+    r'^https?://(?:www\.)?youtube\.com/embed/[\w-]+',
+    r'^https?://youtu\.be/[\w-]+',
+    r'^https?://(?:www\.)?youtube\.com/shorts/[\w-]+',
+    r'^https?://m\.youtube\.com/watch\?v=[\w-]+',
+]
 
-class URLValidator:
-    """URL validation utilities."""
+# All YOUTUBE_PATTERNS as one factored alternation, so a URL is scanned once
+_YT_URL_PATTERN = (
+    r'https?://(?:'
+    r'(?:www\.)?youtube\.com/(?:watch\?v=|embed/|shorts/)'
+    r'|m\.youtube\.com/watch\?v='
+    r'|youtu\.be/'
+    r')[\w-]+'
+)
+_YT_RE = re.compile('^' + _YT_URL_PATTERN)
+
+# Shortest string the matcher accepts: 'http://youtu.be/' plus one ID char
+_YT_MIN_LENGTH = len('http://youtu.be/') + 1
+
+# Unanchored variant for searching URLs inside text
+_YT_FIND_RE = re.compile(_YT_URL_PATTERN)
+
+# Bytes variant, so text read from files or sockets needn't be decoded first
+_YT_FIND_RE_B = re.compile(_YT_URL_PATTERN.encode('ascii'))
+
+# Video ID after 'v=' or any '/', which also covers youtu.be short URLs
+_ID_RE = re.compile(r'(?:v=|/)([\w-]{11})')
+
+# Literal markers that precede a video ID, tried before the regex
+_ID_MARKERS = ('v=', 'youtu.be/', '/embed/', '/shorts/')
+_ID_CHARS = frozenset(string.ascii_letters + string.digits + '-_')
+_ID_LENGTH = 11
+
+# Watch URL prefixes ending in the leftmost 'v=', for normalize_url
+_WATCH_PREFIXES = tuple(
+    f'{scheme}://{host}youtube.com/watch?v='
+    for scheme in ('https', 'http')
+    for host in ('www.', '', 'm.')
+)
+
+# Set to False to extract IDs with the regex only; change via set_fast_video_id
+FAST_VIDEO_ID = True
+
+# Used by is_valid_url for non-ASCII input, where whitespace is Unicode-aware
+_URL_RE = re.compile(r'^https?://[^\s]+\Z')
+
+# Every ASCII character that str.isspace() and \s treat as whitespace
+_ASCII_WHITESPACE = frozenset(c for c in map(chr, range(128)) if c.isspace())
+
+
+def validate_youtube(url: str) -> bool:
+    """
+    Validate YouTube URL.
     
-    # YouTube URL patterns
-    YOUTUBE_PATTERNS = [
-        r'^https?://(www\.)?youtube\.com/watch\?v=[\w-]+',
-        r'^https?://(www\.)?youtube\.com/embed/[\w-]+',
-        r'^https?://youtu\.be/[\w-]+',
-        r'^https?://(www\.)?youtube\.com/shorts/[\w-]+',
-        r'^https?://m\.youtube\.com/watch\?v=[\w-]+',
-    ]
-    
-    @classmethod
-    def validate_youtube(cls, url: str) -> bool:
-        """
-        Validate YouTube URL.
-        
-        Args:
-            url: URL to validate
-        
-        Returns:
-            True if valid YouTube URL
-        """
-        if not url:
-            return False
-        
-        return any(
-            re.match(pattern, url)
-            for pattern in cls.YOUTUBE_PATTERNS
-        )
-    
-    @classmethod
-    def extract_video_id(cls, url: str) -> Optional[str]:
-        """
-        Extract video ID from YouTube URL.
-        
-        Args:
-            url: YouTube URL
-        
-        Returns:
-            Video ID or None
-        """
-        patterns = [
-            r'(?:v=|\/)([\w-]{11})',  # Standard URL
-            r'(?:youtu\.be\/)([\w-]{11})',  # Short URL
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
-        return None
+    Args:
+        url: URL to validate
     
-    @classmethod
-    def normalize_url(cls, url: str) -> str:
-        """
-        Normalize YouTube URL.
-        
-        Args:
-            url: YouTube URL
+    Returns:
+        True if valid YouTube URL
+    """
+    # Cheap string checks reject most non-YouTube input before the regex
+    if (
+        not url
+        or len(url) < _YT_MIN_LENGTH
+        or not url.startswith(('http://', 'https://'))
+        or 'youtu' not in url[:25]
+    ):
+        return False
+    
+    return _YT_RE.match(url) is not None
+
+
+def validate_many(urls: Iterable[str]) -> List[bool]:
+    """
+    Validate many YouTube URLs in one pass.
+    
+    Args:
+        urls: URLs to validate
+    
+    Returns:
+        Validation results in the same order as urls
+    """
+    match = _YT_RE.match
+    return [bool(url) and match(url) is not None for url in urls]
+
+
+def set_fast_video_id(enabled: bool) -> None:
+    """
+    Switch the video ID fast path on or off.
+    
+    Clears the extract_video_id and normalize_url caches, which hold
+    results computed under the previous setting.
+    
+    Args:
+        enabled: Whether to try literal markers before the regex
+    """
+    global FAST_VIDEO_ID
+    FAST_VIDEO_ID = enabled
+    extract_video_id.cache_clear()
+    normalize_url.cache_clear()
+
+
+@functools.lru_cache(maxsize=4096)
+def extract_video_id(url: str) -> Optional[str]:
+    """
+    Extract video ID from YouTube URL.
+    
+    Results are memoized; use set_fast_video_id() to change FAST_VIDEO_ID.
+    
+    With FAST_VIDEO_ID, the ID after the leftmost marker (v=, youtu.be/,
+    /embed/, /shorts/) is returned, like the regex would. The one
+    difference: the regex also accepts an ID after any earlier '/', so
+    for URLs such as https://example.com/abcdefghijklm?v=<id> it returns
+    the path segment while the fast path returns <id>.
+    
+    Args:
+        url: YouTube URL
+    
+    Returns:
+        Video ID or None
+    """
+    if FAST_VIDEO_ID:
+        found = []
+        for marker in _ID_MARKERS:
+            index = url.find(marker)
+            if index >= 0:
+                found.append((index, index + len(marker)))
         
-        Returns:
-            Normalized URL
-        """
-        video_id = cls.extract_video_id(url)
-        if video_id:
+        if found:
+            # Only the leftmost marker agrees with the regex; if its ID is
+            # malformed, let the regex decide
+            start = min(found)[1]
+            candidate = url[start:start + _ID_LENGTH]
+            if len(candidate) == _ID_LENGTH and _ID_CHARS.issuperset(candidate):
+                return candidate
+    
+    match = _ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_url(url: str) -> str:
+    """
+    Normalize YouTube URL.
+    
+    Results are memoized, so url must be hashable; use set_fast_video_id()
+    to change FAST_VIDEO_ID.
+    
+    Args:
+        url: YouTube URL
+    
+    Returns:
+        Normalized URL
+    """
+    # Common case: a watch URL, whose 'v=' is the leftmost marker, so the ID
+    # after it is what extract_video_id would return
+    if FAST_VIDEO_ID and url.startswith(_WATCH_PREFIXES):
+        _, marker, tail = url.partition('v=')
+        video_id = tail[:_ID_LENGTH]
+        if marker and len(video_id) == _ID_LENGTH and _ID_CHARS.issuperset(video_id):
             return f"https://www.youtube.com/watch?v={video_id}"
-        return url
     
-    @classmethod
-    def extract_urls(cls, text: str) -> List[str]:
-        """
-        Extract all YouTube URLs from text.
-        
-        Args:
-            text: Text containing URLs
-        
-        Returns:
-            List of YouTube URLs
-        """
-        urls = []
-        for pattern in cls.YOUTUBE_PATTERNS:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                if isinstance(match, tuple):
-                    match = match[0]
-                if not match.startswith('http'):
-                    match = 'https://www.youtube.com/' + match
-                urls.append(match)
-        return urls
-    
-    @staticmethod
-    def is_valid_url(url: str) -> bool:
-        """
-        Basic URL validation.
-        
-        Args:
-            url: URL to validate
-        
-        Returns:
-            True if valid URL format
-        """
-        pattern = r'^https?://[^\s]+$'
-        return bool(re.match(pattern, url))
+    video_id = extract_video_id(url)
+    if video_id:
+        return f"https://www.youtube.com/watch?v={video_id}"
+    return url
+
+
+def extract_urls(text: AnyStr) -> List[AnyStr]:
+    """
+    Extract all YouTube URLs from text.
+    
+    Args:
+        text: Text containing URLs, as str or bytes
+    
+    Returns:
+        List of YouTube URLs, of the same type as text
+    """
+    pattern = _YT_FIND_RE_B if isinstance(text, (bytes, bytearray)) else _YT_FIND_RE
+    return [match.group(0) for match in pattern.finditer(text)]
+
+
+def is_valid_url(url: str) -> bool:
+    """
+    Basic URL validation.
+    
+    Args:
+        url: URL to validate
+    
+    Returns:
+        True if valid URL format
+    """
+    if not url.isascii():
+        return _URL_RE.match(url) is not None
+    
+    if url.startswith('https://'):
+        rest_start = 8
+    elif url.startswith('http://'):
+        rest_start = 7
+    else:
+        return False
+    
+    return len(url) > rest_start and _ASCII_WHITESPACE.isdisjoint(url)
+
+
+class URLValidator:
+    """URL validation utilities."""
+    
+    # Pure namespace: all state lives in module globals
+    __slots__ = ()
+    
+    YOUTUBE_PATTERNS = YOUTUBE_PATTERNS
+    
+    # Module-level functions exposed as staticmethods, so calls skip cls binding
+    validate_youtube = staticmethod(validate_youtube)
+    validate_many = staticmethod(validate_many)
+    extract_video_id = staticmethod(extract_video_id)
+    normalize_url = staticmethod(normalize_url)
+    set_fast_video_id = staticmethod(set_fast_video_id)
+    extract_urls = staticmethod(extract_urls)
+    is_valid_url = staticmethod(is_valid_url)